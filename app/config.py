@@ -2,6 +2,7 @@
 
 # Serial port configuration
 TIMEOUT = 50  # milliseconds
+RX_BUFFER_SIZE = 64 * 1024  # driver receive buffer, where it can be set
 DEFAULT_BAUD_RATE = 115200
 COMMON_BAUD_RATES = [
     300, 1200, 2400, 4800, 9600, 19200, 38400, 
@@ -16,7 +17,8 @@ AUTHOR_LINK = "https://github.com/mrxrinc"
 
 # Timer intervals (milliseconds)
 PORT_REFRESH_INTERVAL = 1000
-LOGGER_INTERVAL = TIMEOUT
+PORT_RESCAN_INTERVAL = 5000  # Windows: rescan even without a device change
+LOG_FLUSH_INTERVAL = 50  # serial lines are appended at most this often
 
 # UI configuration
 WINDOW_WIDTH_RATIO = 1.3
@@ -24,6 +26,7 @@ WINDOW_HEIGHT_RATIO = 1.2
 PORT_LIST_WIDTH = 220
 LOG_FONT_SIZE = 14
 LOG_FONT_FAMILIES = ["Menlo", "Consolas", "Courier New"]
+MAX_LOG_LINES = 5000  # per-port log blocks kept; oldest are dropped
 
 # ESP32 reboot timing
 ESP32_REBOOT_DELAY = 100  # milliseconds
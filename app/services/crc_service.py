@@ -1,17 +1,55 @@
 """CRC32 calculation service for file integrity checking."""
 
+import mmap
+import os
+import stat
 import zlib
-from typing import Tuple, Optional
+from collections import OrderedDict
+from typing import BinaryIO, Callable, Dict, Tuple
+
+try:
+    # Optional SIMD (PCLMULQDQ) accelerated CRC-32/ISO-HDLC implementation
+    from fastcrc import crc32 as _fastcrc32
+except ImportError:
+    _fastcrc32 = None
+
+
+# Block size fed to the CRC backend. zlib.crc32 releases the GIL on blocks
+# this large, so the GUI keeps running during the hash, and its own loop is
+# accelerated when Python links a zlib built with PCLMULQDQ (e.g. zlib-ng).
+CHUNK_SIZE = 1024 * 1024
+
+# Files larger than this are memory-mapped instead of read into buffers
+MMAP_THRESHOLD = 1024 * 1024
+
+# Number of recent file checksums remembered by CRCService
+CRC_CACHE_SIZE = 32
+
+# Available CRC-32/ISO-HDLC backends, each called as backend(data, crc).
+# CRC-32C (Castagnoli) uses a different polynomial and would produce
+# different checksums, so hardware crc32c implementations are not offered.
+CRC32_BACKENDS: Dict[str, Callable[[bytes, int], int]] = {'zlib': zlib.crc32}
+if _fastcrc32 is not None:
+    CRC32_BACKENDS['fastcrc'] = _fastcrc32.iso_hdlc
 
 
 class CRCService:
     """Service for calculating CRC32 checksums of files."""
     
-    @staticmethod
-    def calculate_crc32(file_path: str) -> Tuple[int, int, str]:
+    # Name of the CRC32_BACKENDS entry used for calculations
+    backend: str = 'fastcrc' if 'fastcrc' in CRC32_BACKENDS else 'zlib'
+    
+    # Least recently used checksums by (absolute path, mtime_ns, size)
+    _cache: 'OrderedDict[Tuple[str, int, int], int]' = OrderedDict()
+    
+    @classmethod
+    def calculate_crc32(cls, file_path: str) -> Tuple[int, int, str]:
         """
         Calculate CRC32 checksum for a file.
         
+        Results for regular files are cached until the file's modification
+        time or size changes.
+        
         Args:
             file_path: Path to the file to calculate CRC for
             
@@ -22,15 +60,81 @@ class CRCService:
             FileNotFoundError: If file doesn't exist
             IOError: If file cannot be read
         """
-        with open(file_path, 'rb') as f:
-            file_data = f.read()
-            crc32 = zlib.crc32(file_data) & 0xffffffff
+        crc_func = CRC32_BACKENDS[cls.backend]
+        file_name = os.path.basename(file_path)
+        with open(file_path, 'rb', buffering=0) as f:
+            st = os.fstat(f.fileno())
+            is_regular = stat.S_ISREG(st.st_mode)
+            key = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+            if is_regular and key in cls._cache:
+                cls._cache.move_to_end(key)
+                return cls._cache[key], st.st_size, file_name
+            
+            crc32 = None
+            # Only large regular files are mapped; devices and pipes are read
+            if is_regular and st.st_size > MMAP_THRESHOLD:
+                try:
+                    crc32, file_size = cls._crc32_mmap(f, crc_func)
+                except (OSError, ValueError):
+                    # Mapping unsupported (e.g. some network filesystems)
+                    f.seek(0)
+            if crc32 is None:
+                crc32, file_size = cls._crc32_stream(f, crc_func)
         
-        file_size = len(file_data)
-        file_name = file_path.split('/')[-1]
+        crc32 &= 0xffffffff
+        if is_regular:
+            cls._cache[key] = crc32
+            if len(cls._cache) > CRC_CACHE_SIZE:
+                cls._cache.popitem(last=False)
         
         return crc32, file_size, file_name
     
+    @staticmethod
+    def _crc32_stream(f: BinaryIO, crc_func: Callable) -> Tuple[int, int]:
+        """
+        Calculate CRC32 by reading a file in chunks.
+        
+        Args:
+            f: File opened in binary mode
+            crc_func: CRC32 backend function
+            
+        Returns:
+            Tuple of (crc32_value, file_size_bytes)
+        """
+        read = f.read
+        crc32 = 0
+        file_size = 0
+        while True:
+            chunk = read(CHUNK_SIZE)
+            if not chunk:
+                break
+            crc32 = crc_func(chunk, crc32)
+            file_size += len(chunk)
+        return crc32, file_size
+    
+    @staticmethod
+    def _crc32_mmap(f: BinaryIO, crc_func: Callable) -> Tuple[int, int]:
+        """
+        Calculate CRC32 over a memory-mapped file without copying its data.
+        
+        Args:
+            f: File opened in binary mode
+            crc_func: CRC32 backend function
+            
+        Returns:
+            Tuple of (crc32_value, file_size_bytes)
+        """
+        crc32 = 0
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            with memoryview(mm) as view:
+                file_size = len(view)
+                for offset in range(0, file_size, CHUNK_SIZE):
+                    crc32 = crc_func(view[offset:offset + CHUNK_SIZE], crc32)
+        finally:
+            mm.close()
+        return crc32, file_size
+    
     @staticmethod
     def format_crc32_hex(crc32_value: int) -> str:
         """
@@ -1,9 +1,13 @@
 """Serial port management service."""
 
+import re
 import serial
-import serial.tools.list_ports
 from typing import Dict, List, Optional, Callable
-from app.config import TIMEOUT
+from app.config import TIMEOUT, RX_BUFFER_SIZE
+
+
+# Marks a port as USB when it reports no vendor ID
+_USB_PATTERN = re.compile('usb', re.IGNORECASE)
 
 
 class SerialPortService:
@@ -18,6 +22,7 @@ class SerialPortService:
         """
         self.baud_rate = baud_rate
         self.connections: Dict[str, serial.Serial] = {}
+        self._rx_buffers: Dict[str, bytearray] = {}
     
     def get_available_usb_ports(self) -> List[str]:
         """
@@ -26,11 +31,17 @@ class SerialPortService:
         Returns:
             List of USB port device names
         """
+        # Imported on first use; loads platform enumeration backends
+        import serial.tools.list_ports
+        
         all_ports = serial.tools.list_ports.comports()
+        # USB devices report a vendor ID; the name checks catch drivers that don't
         return [
             port.device 
             for port in all_ports 
-            if 'usb' in port.device.lower() or 'USB' in port.description
+            if port.vid is not None
+            or _USB_PATTERN.search(port.device)
+            or _USB_PATTERN.search(port.description or '')
         ]
     
     def open_port(self, port_name: str) -> bool:
@@ -53,7 +64,20 @@ class SerialPortService:
                 baudrate=self.baud_rate, 
                 timeout=TIMEOUT / 1000
             )
+            
+            # Only Windows drivers allow it; their small default buffer can
+            # overflow during a burst while the GUI is busy
+            if hasattr(serial_port, 'set_buffer_size'):
+                serial_port.set_buffer_size(rx_size=RX_BUFFER_SIZE)
+            
             self.connections[port_name] = serial_port
+            self._rx_buffers[port_name] = bytearray()
+            
+            # Ports with a descriptor are read on the GUI thread once they are
+            # readable, so reads must never wait; the others keep the timeout
+            # for the reader thread that blocks on them
+            if self.get_port_fileno(port_name) is not None:
+                serial_port.timeout = 0
             return True
             
         except (serial.SerialException, AttributeError, OSError):
@@ -72,41 +96,84 @@ class SerialPortService:
             except:
                 pass
             del self.connections[port_name]
+        self._rx_buffers.pop(port_name, None)
     
     def close_all_ports(self) -> None:
         """Close all open serial port connections."""
         for port_name in list(self.connections.keys()):
             self.close_port(port_name)
     
-    def read_line(self, port_name: str) -> Optional[str]:
+    def get_port_fileno(self, port_name: str) -> Optional[int]:
         """
-        Read a line from a serial port.
+        Get the OS file descriptor of an open serial port.
         
         Args:
-            port_name: Name of the port to read from
+            port_name: Name of the port
             
         Returns:
-            Decoded line string or None if no data or error
+            File descriptor, or None if not connected or not supported
+            by the platform (e.g. Windows)
         """
         if port_name not in self.connections:
             return None
         
+        try:
+            return self.connections[port_name].fileno()
+        except (serial.SerialException, AttributeError, OSError, ValueError):
+            return None
+    
+    def read_lines(self, port_name: str, ready: bool = False) -> List[bytes]:
+        """
+        Read all complete lines currently available on a serial port.
+        
+        Drains the input buffer with a single read; a trailing partial
+        line is kept and completed by a later call. Lines are returned
+        undecoded so color codes can be matched on the raw bytes.
+        
+        Args:
+            port_name: Name of the port to read from
+            ready: True to read at least one byte, waiting up to the port
+                timeout, so hang-ups are detected
+            
+        Returns:
+            List of stripped, non-empty raw lines (empty if no data or error)
+        """
+        if port_name not in self.connections:
+            return []
+        
         serial_port = self.connections[port_name]
         
         try:
             if not serial_port.is_open:
-                return None
+                return []
+            
+            waiting = serial_port.in_waiting
+            if waiting <= 0 and not ready:
+                return []
             
-            if serial_port.in_waiting > 0:
-                line = serial_port.readline().decode('utf-8', errors='ignore').strip()
-                return line if line else None
+            data = serial_port.read(waiting or 1)
             
         except (serial.SerialException, AttributeError, OSError):
             # Connection error, remove it
             self.close_port(port_name)
-            return None
+            return []
+        
+        # Append in place and cut off only the complete lines, so a long
+        # partial line isn't copied again on every read
+        buffer = self._rx_buffers.setdefault(port_name, bytearray())
+        buffer += data
+        end = buffer.rfind(b'\n')
+        if end < 0:
+            return []
+        complete = bytes(buffer[:end])
+        del buffer[:end + 1]
         
-        return None
+        lines = []
+        for raw_line in complete.split(b'\n'):
+            line = raw_line.strip()
+            if line:
+                lines.append(line)
+        return lines
     
     def set_baud_rate(self, baud_rate: int) -> None:
         """
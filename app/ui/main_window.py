@@ -1,25 +1,36 @@
 """Main application window."""
 
+import sys
+import time
 from datetime import datetime
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, 
-    QTextEdit, QPushButton, QListWidget, QFileDialog, QMessageBox, 
-    QAction, QMenuBar, QApplication
+    QPlainTextEdit, QPlainTextDocumentLayout, QPushButton, QListWidget,
+    QFileDialog, QMessageBox, QAction, QMenuBar, QApplication, QListWidgetItem
 )
-from PyQt5.QtCore import QTimer, Qt
-from typing import Dict, List
+from PyQt5.QtCore import QSocketNotifier, QTimer, QThread, QThreadPool, Qt
+from PyQt5.QtGui import QColor, QFont, QTextCharFormat, QTextCursor, QTextDocument
+from typing import Dict, List, Optional, Tuple
 
 from app.config import (
     DEFAULT_BAUD_RATE, COMMON_BAUD_RATES, VERSION, APP_NAME, 
-    AUTHOR_LINK, PORT_REFRESH_INTERVAL, LOGGER_INTERVAL,
-    PORT_LIST_WIDTH, LOG_FONT_SIZE, LOG_FONT_FAMILIES,
-    WINDOW_WIDTH_RATIO, WINDOW_HEIGHT_RATIO, ESP32_REBOOT_DELAY
+    AUTHOR_LINK, PORT_REFRESH_INTERVAL, PORT_RESCAN_INTERVAL,
+    LOG_FLUSH_INTERVAL, PORT_LIST_WIDTH, LOG_FONT_SIZE, LOG_FONT_FAMILIES,
+    WINDOW_WIDTH_RATIO, WINDOW_HEIGHT_RATIO, ESP32_REBOOT_DELAY,
+    MAX_LOG_LINES
 )
 from app.services import CRCService, SerialPortService
+from app.ui.workers import CrcWorker, PortScanner, SerialReader
 from app.utils import LogFormatter
 from app.widgets import DropButton, ClickableLabel
 
 
+# Windows message broadcast when a device is added or removed
+_WM_DEVICECHANGE = 0x0219
+if sys.platform == 'win32':
+    from ctypes import wintypes
+
+
 class MainWindow(QWidget):
     """Main application window for serial port monitoring."""
     
@@ -33,20 +44,35 @@ class MainWindow(QWidget):
         self.log_formatter = LogFormatter()
         
         # State management
-        self.port_logs: Dict[str, List[str]] = {}
+        self._port_docs: Dict[str, QTextDocument] = {}
         self.active_port: str = None
         self.auto_scroll: bool = True
+        self._crc_worker: Optional[CrcWorker] = None
+        self._notifiers: Dict[str, QSocketNotifier] = {}
+        self._readers: Dict[str, Tuple[QThread, SerialReader]] = {}
+        self._pending_lines: Dict[str, List[bytes]] = {}
+        self._port_items: Dict[str, QListWidgetItem] = {}
+        self._placeholder_item: Optional[QListWidgetItem] = None
+        self._port_scanner: Optional[PortScanner] = None
+        self._closing: bool = False
+        
+        # Own pool so closing can wait for a running scan, and only for that
+        self._scan_pool = QThreadPool(self)
+        self._scan_pool.setMaxThreadCount(1)
+        self._ports_dirty: bool = True
+        self._last_port_scan: float = 0.0
+        self._line_formats: Dict[Optional[str], QTextCharFormat] = {None: QTextCharFormat()}
         
         # Setup UI
         self._setup_window()
         self._create_menu_bar()
-        self._create_ui()
         self._setup_timers()
+        self._create_ui()
         
     def _setup_window(self):
         """Configure window properties."""
         self.setWindowTitle(f'mrxrinc | Serial Port Monitor')
-        screen = QApplication.desktop().screenGeometry()
+        screen = QApplication.primaryScreen().availableGeometry()
         self.resize(
             int(screen.width() // WINDOW_WIDTH_RATIO), 
             int(screen.height() // WINDOW_HEIGHT_RATIO)
@@ -78,7 +104,7 @@ class MainWindow(QWidget):
         main_layout.addLayout(right_layout)
         
         # Initial port population
-        self._populate_serial_ports()
+        self._refresh_serial_ports()
     
     def _create_left_panel(self) -> QVBoxLayout:
         """Create the left control panel."""
@@ -119,18 +145,6 @@ class MainWindow(QWidget):
         )
         self.crc_button.setFixedWidth(PORT_LIST_WIDTH)
         self.crc_button.setFixedHeight(80)
-        self.crc_button.setStyleSheet("""
-            QPushButton {
-                border: 2px dashed rgba(0, 0, 0, 0.3);
-                border-radius: 5px;
-                background-color: rgba(0, 120, 215, 0.05);
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: rgba(0, 120, 215, 0.1);
-                border: 2px dashed rgba(0, 120, 215, 0.5);
-            }
-        """)
         self.crc_button.clicked.connect(self._select_file_for_crc)
         layout.addWidget(self.crc_button)
         
@@ -139,20 +153,6 @@ class MainWindow(QWidget):
         self.crc_result.setFixedHeight(100)
         self.crc_result.setWordWrap(True)
         self.crc_result.setTextFormat(Qt.RichText)
-        self.crc_result.setStyleSheet("""
-            QLabel {
-                font-size: 11px;
-                color: gray;
-                padding: 15px;
-                border: 1px solid rgba(0, 0, 0, 0.2);
-                border-radius: 5px;
-                background-color: rgba(0, 0, 0, 0.02);
-            }
-            QLabel:hover {
-                background-color: rgba(0, 120, 215, 0.05);
-                border: 1px solid rgba(0, 120, 215, 0.3);
-            }
-        """)
         layout.addWidget(self.crc_result)
         
         return layout
@@ -164,16 +164,20 @@ class MainWindow(QWidget):
         self.log_label = QLabel('Logs:')
         layout.addWidget(self.log_label)
         
-        self.log_text_edit = QTextEdit()
+        # Plain text layout skips rich-text layout work; colors still apply
+        self.log_text_edit = QPlainTextEdit()
         self.log_text_edit.setReadOnly(True)
-        font = self.log_text_edit.font()
-        font.setPointSize(LOG_FONT_SIZE)
-        font.setFamilies(LOG_FONT_FAMILIES)
-        self.log_text_edit.setFont(font)
-        
-        # Connect scrollbar to detect user scrolling
-        scrollbar = self.log_text_edit.verticalScrollBar()
-        scrollbar.valueChanged.connect(self._on_scroll_changed)
+        self.log_text_edit.setUndoRedoEnabled(False)
+        self.log_text_edit.setMaximumBlockCount(MAX_LOG_LINES)
+        # Built once and shared by the view and every port document
+        self._log_font = QFont()
+        self._log_font.setFamilies(LOG_FONT_FAMILIES)
+        self._log_font.setPointSize(LOG_FONT_SIZE)
+        self.log_text_edit.setFont(self._log_font)
+        
+        # Connect scrollbar to detect user scrolling; kept for every append
+        self._log_scrollbar = self.log_text_edit.verticalScrollBar()
+        self._log_scrollbar.valueChanged.connect(self._on_scroll_changed)
         
         layout.addWidget(self.log_text_edit)
         
@@ -183,15 +187,7 @@ class MainWindow(QWidget):
         """Create the port list widget."""
         port_list = QListWidget()
         port_list.setFixedWidth(PORT_LIST_WIDTH)
-        port_list.setStyleSheet("""
-            QListWidget::item {
-                border-bottom: 1px solid rgba(0, 0, 0, 0.1);
-                padding: 5px;
-            }
-            QListWidget::item:selected {
-                background-color: rgba(0, 120, 215, 0.15);
-            }
-        """)
+        port_list.setProperty('role', 'ports')
         port_list.setWordWrap(True)
         port_list.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         port_list.currentItemChanged.connect(self._on_port_selected)
@@ -201,8 +197,7 @@ class MainWindow(QWidget):
         """Create the baud rate combo box."""
         combo = QComboBox()
         combo.setFixedWidth(PORT_LIST_WIDTH)
-        for rate in COMMON_BAUD_RATES:
-            combo.addItem(str(rate))
+        combo.addItems([str(rate) for rate in COMMON_BAUD_RATES])
         combo.setCurrentText(str(DEFAULT_BAUD_RATE))
         combo.currentTextChanged.connect(self._on_baud_rate_changed)
         return combo
@@ -218,13 +213,14 @@ class MainWindow(QWidget):
         """Setup application timers."""
         # Port refresh timer
         self.port_refresh_timer = QTimer()
-        self.port_refresh_timer.timeout.connect(self._populate_serial_ports)
+        self.port_refresh_timer.timeout.connect(self._refresh_serial_ports)
         self.port_refresh_timer.start(PORT_REFRESH_INTERVAL)
         
-        # Logger timer
-        self.logger_timer = QTimer()
-        self.logger_timer.timeout.connect(self._logger)
-        self.logger_timer.start(LOGGER_INTERVAL)
+        # Log flush timer, coalesces serial lines into one append per interval
+        self.log_flush_timer = QTimer()
+        self.log_flush_timer.setSingleShot(True)
+        self.log_flush_timer.setInterval(LOG_FLUSH_INTERVAL)
+        self.log_flush_timer.timeout.connect(self._flush_logs)
     
     # Event handlers
     
@@ -250,17 +246,18 @@ class MainWindow(QWidget):
         """Handle port selection change."""
         if current:
             port_name = current.text()
+            previous_port = self.active_port
             self.active_port = port_name
             
             # Display logs for selected port
-            if port_name in self.port_logs:
-                self.log_text_edit.setHtml(''.join(self.port_logs[port_name]))
-                # Scroll to bottom when switching ports
-                scrollbar = self.log_text_edit.verticalScrollBar()
-                scrollbar.setValue(scrollbar.maximum())
-                self.auto_scroll = True
-            else:
-                self.log_text_edit.clear()
+            self.log_text_edit.setDocument(self._get_port_doc(port_name))
+            
+            # Logs of a disconnected port are only kept while on display
+            if previous_port and previous_port not in self._port_items:
+                self._discard_port_doc(previous_port)
+            # Scroll to bottom when switching ports
+            self._log_scrollbar.setValue(self._log_scrollbar.maximum())
+            self.auto_scroll = True
             
             # Update label
             self.log_label.setText(f'Logs for {port_name}:')
@@ -273,67 +270,94 @@ class MainWindow(QWidget):
     
     def _on_scroll_changed(self, value: int):
         """Detect if user scrolled away from bottom."""
-        scrollbar = self.log_text_edit.verticalScrollBar()
-        # Check if we're at the bottom (within 10 pixels tolerance)
-        at_bottom = value >= scrollbar.maximum() - 10
+        # The plain text view scrolls by lines, so any offset means scrolled up
+        at_bottom = value >= self._log_scrollbar.maximum()
         self.auto_scroll = at_bottom
     
-    def _populate_serial_ports(self):
-        """Update the list of available serial ports."""
-        ports = self.serial_service.get_available_usb_ports()
-        current_ports = [self.port_list.item(i).text() for i in range(self.port_list.count())]
+    def _refresh_serial_ports(self):
+        """Enumerate serial ports in the thread pool, one scan at a time."""
+        if self._port_scanner is not None:
+            return
+        
+        # Windows announces device changes, so ports are rescanned then;
+        # a slow periodic rescan catches ports that appear without one
+        now = time.monotonic()
+        if sys.platform == 'win32':
+            stale = now - self._last_port_scan >= PORT_RESCAN_INTERVAL / 1000
+            if not (self._ports_dirty or stale):
+                return
+            self._ports_dirty = False
+        self._last_port_scan = now
+        
+        self._port_scanner = PortScanner(self.serial_service)
+        self._port_scanner.signals.finished.connect(self._on_ports_scanned)
+        self._scan_pool.start(self._port_scanner)
+    
+    def _on_ports_scanned(self, ports: List[str]):
+        """Apply the result of a port scan, unless the window was closed."""
+        # The scanner is referenced until now; its signals must outlive run()
+        self._port_scanner = None
+        if not self._closing:
+            self._populate_serial_ports(ports)
+    
+    def _populate_serial_ports(self, ports: List[str]):
+        """
+        Update the list of available serial ports.
+        
+        Args:
+            ports: Available port names from a port scan
+        """
+        ports_set = set(ports)
+        current_ports = set(self._port_items)
         current_selection = self.port_list.currentItem()
         current_selection_text = current_selection.text() if current_selection else None
 
         # Remove ports that are no longer available
-        for port in current_ports:
-            if port not in ports:
-                self.serial_service.close_port(port)
-                
-                # Remove from list
-                for i in range(self.port_list.count()):
-                    if self.port_list.item(i).text() == port:
-                        self.port_list.takeItem(i)
-                        break
+        for port in current_ports - ports_set:
+            self._unwatch_port(port)
+            self.serial_service.close_port(port)
+            self.port_list.takeItem(self.port_list.row(self._port_items.pop(port)))
+            self._pending_lines.pop(port, None)
+            self._discard_port_doc(port)
 
         # Add new ports
         for port in ports:
             if port not in current_ports:
-                self.port_list.addItem(port)
+                item = QListWidgetItem(port)
+                self.port_list.addItem(item)
+                self._port_items[port] = item
+                self._get_port_doc(port).clear()
                 self._start_serial_monitor(port)
-                self.port_logs[port] = []
 
         # Show empty message if no ports
-        if len(ports) == 0 and self.port_list.count() == 0:
-            self.port_list.addItem("No USB devices connected")
-            item = self.port_list.item(0)
+        if not ports and self._placeholder_item is None:
+            item = QListWidgetItem("No USB devices connected")
             item.setFlags(item.flags() & ~Qt.ItemIsSelectable)
             item.setTextAlignment(Qt.AlignCenter)
             item.setForeground(QApplication.palette().color(self.port_list.foregroundRole()))
             font = item.font()
             font.setItalic(True)
             item.setFont(font)
+            self.port_list.addItem(item)
+            self._placeholder_item = item
         # Remove placeholder if ports are found
-        elif len(ports) > 0 and self.port_list.count() > 0:
-            first_item = self.port_list.item(0)
-            if first_item and first_item.text() == "No USB devices connected":
-                self.port_list.takeItem(0)
+        elif ports and self._placeholder_item is not None:
+            self.port_list.takeItem(self.port_list.row(self._placeholder_item))
+            self._placeholder_item = None
 
         # Restore selection if still available
-        if current_selection_text and current_selection_text in ports:
-            for i in range(self.port_list.count()):
-                if self.port_list.item(i).text() == current_selection_text:
-                    self.port_list.setCurrentRow(i)
-                    break
-        elif self.port_list.count() > 0 and not current_selection:
-            if self.port_list.item(0).text() != "No USB devices connected":
-                self.port_list.setCurrentRow(0)
+        if current_selection_text in self._port_items:
+            self.port_list.setCurrentItem(self._port_items[current_selection_text])
+        elif self._port_items and not current_selection:
+            self.port_list.setCurrentRow(0)
     
     def _start_serial_monitor(self, port: str):
         """Start monitoring a serial port."""
+        self._unwatch_port(port)
         success = self.serial_service.open_port(port)
         
         if success:
+            self._watch_port(port)
             log_entry = self.log_formatter.create_success_message(
                 f'Connected to {port} at {self.serial_service.baud_rate} baud'
             )
@@ -342,40 +366,213 @@ class MainWindow(QWidget):
                 f'Failed to connect to {port}'
             )
         
-        if port not in self.port_logs:
-            self.port_logs[port] = []
-        self.port_logs[port].append(log_entry)
+        self._append_to_port(port, [log_entry])
+    
+    def _watch_port(self, port: str):
+        """
+        Get notified when a serial port has data to read.
+        
+        Ports whose file descriptor can't be watched (e.g. on Windows)
+        are read by a SerialReader in a background thread instead.
+        
+        Args:
+            port: Name of the port to watch
+        """
+        fd = self.serial_service.get_port_fileno(port)
+        if fd is not None:
+            notifier = QSocketNotifier(fd, QSocketNotifier.Read, self)
+            notifier.activated.connect(lambda _, p=port: self._drain_port(p))
+            self._notifiers[port] = notifier
+            return
+        
+        thread = QThread()
+        reader = SerialReader(self.serial_service, port)
+        reader.moveToThread(thread)
+        thread.started.connect(reader.run)
+        reader.lines_read.connect(self._log_lines)
+        reader.finished.connect(self._on_reader_finished)
+        reader.finished.connect(thread.quit)
+        self._readers[port] = (thread, reader)
+        thread.start()
+    
+    def _unwatch_port(self, port: str):
+        """
+        Stop watching a serial port, before its file descriptor is closed.
+        
+        Args:
+            port: Name of the port to stop watching
+        """
+        notifier = self._notifiers.pop(port, None)
+        if notifier:
+            notifier.setEnabled(False)
+            notifier.deleteLater()
+        
+        thread, reader = self._readers.pop(port, (None, None))
+        if thread:
+            reader.stop()
+            thread.quit()
+            thread.wait()
+            reader.deleteLater()
+            thread.deleteLater()
+    
+    def _drain_port(self, port_name: str):
+        """Read and log data from a port reported readable."""
+        self._log_lines(port_name, self.serial_service.read_lines(port_name, ready=True))
+        
+        # Port was closed after a read error
+        if port_name not in self.serial_service.connections:
+            self._unwatch_port(port_name)
+    
+    def _on_reader_finished(self, port_name: str):
+        """Clean up after a reader thread stopped on a closed port."""
+        if port_name not in self.serial_service.connections:
+            self._unwatch_port(port_name)
+    
+    def _log_lines(self, port_name: str, lines: List[bytes]):
+        """
+        Queue lines read from a serial port for the next log flush.
+        
+        Args:
+            port_name: Name of the port the lines were read from
+            lines: Raw lines without line endings
+        """
+        # A stopped reader may still have batches queued for a removed port
+        if (port_name not in self._port_items
+                or port_name not in self.serial_service.connections):
+            return
+        if lines:
+            self._pending_lines.setdefault(port_name, []).extend(lines)
+            if not self.log_flush_timer.isActive():
+                self.log_flush_timer.start()
+    
+    def _flush_logs(self):
+        """Colorize and append the queued lines of all ports."""
+        for port_name in list(self._pending_lines):
+            self._flush_port(port_name)
+    
+    def _flush_port(self, port_name: str):
+        """
+        Colorize and append the queued lines of a port.
         
-        if self.active_port == port:
-            self.log_text_edit.append(log_entry)
+        Args:
+            port_name: Name of the port
+        """
+        lines = self._pending_lines.pop(port_name, None)
+        if lines:
+            # Lines beyond the document capacity would be dropped right away
+            if len(lines) > MAX_LOG_LINES:
+                lines = lines[-MAX_LOG_LINES:]
+            self._append_lines(port_name, self.log_formatter.parse_batch(lines))
     
-    def _logger(self):
-        """Read and log data from all serial ports."""
-        for port_name in list(self.serial_service.connections.keys()):
-            line = self.serial_service.read_line(port_name)
+    def _get_port_doc(self, port_name: str) -> QTextDocument:
+        """
+        Get the log document of a port, creating it if needed.
+        
+        Args:
+            port_name: Name of the port
             
-            if line:
-                colorized_line = self.log_formatter.colorize_line(line)
-                
-                # Store in logs
-                if port_name not in self.port_logs:
-                    self.port_logs[port_name] = []
-                self.port_logs[port_name].append(colorized_line)
-                
-                # Display if active port
-                if self.active_port == port_name:
-                    self.log_text_edit.append(colorized_line)
-                    # Only auto-scroll if user hasn't scrolled up
-                    if self.auto_scroll:
-                        scrollbar = self.log_text_edit.verticalScrollBar()
-                        scrollbar.setValue(scrollbar.maximum())
+        Returns:
+            Document holding the port's log
+        """
+        doc = self._port_docs.get(port_name)
+        if doc is None:
+            doc = QTextDocument(self)
+            doc.setDocumentLayout(QPlainTextDocumentLayout(doc))
+            doc.setDefaultFont(self._log_font)
+            doc.setMaximumBlockCount(MAX_LOG_LINES)
+            doc.setUndoRedoEnabled(False)
+            self._port_docs[port_name] = doc
+        return doc
+    
+    def _discard_port_doc(self, port_name: str):
+        """
+        Free the log document of a removed port unless it is on display.
+        
+        Args:
+            port_name: Name of the port
+        """
+        doc = self._port_docs.get(port_name)
+        if doc is not None and doc is not self.log_text_edit.document():
+            del self._port_docs[port_name]
+            doc.deleteLater()
+    
+    def _append_to_port(self, port_name: str, entries: List[str]):
+        """
+        Append log entries to a port's log in a single insert.
+        
+        Args:
+            port_name: Name of the port
+            entries: HTML paragraphs to append
+        """
+        # Keep queued serial lines ahead of the new entries
+        self._flush_port(port_name)
+        
+        doc = self._get_port_doc(port_name)
+        cursor = QTextCursor(doc)
+        cursor.movePosition(QTextCursor.End)
+        if not doc.isEmpty():
+            cursor.insertBlock()
+        cursor.insertHtml(''.join(entries))
+        
+        self._scroll_to_new_entries(port_name)
+    
+    def _append_lines(self, port_name: str, lines: List[Tuple[Optional[str], str]]):
+        """
+        Append serial lines to a port's log as plain text in one edit block.
+        
+        Colored lines are inserted with a cached character format, so no
+        HTML has to be parsed for serial data.
+        
+        Args:
+            port_name: Name of the port
+            lines: (color, text) tuples from LogFormatter.parse_batch
+        """
+        doc = self._get_port_doc(port_name)
+        cursor = QTextCursor(doc)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        needs_block = not doc.isEmpty()
+        for color, text in lines:
+            if needs_block:
+                cursor.insertBlock()
+            cursor.insertText(text, self._get_line_format(color))
+            needs_block = True
+        cursor.endEditBlock()
+        
+        self._scroll_to_new_entries(port_name)
+    
+    def _get_line_format(self, color: Optional[str]) -> QTextCharFormat:
+        """
+        Get the character format for a log line color, creating it if needed.
+        
+        Args:
+            color: Color name, or None for plain lines
+            
+        Returns:
+            Character format with that foreground color
+        """
+        line_format = self._line_formats.get(color)
+        if line_format is None:
+            line_format = QTextCharFormat()
+            line_format.setForeground(QColor(color))
+            self._line_formats[color] = line_format
+        return line_format
+    
+    def _scroll_to_new_entries(self, port_name: str):
+        """Keep the view at the bottom after appending to the active port."""
+        # Only auto-scroll if user hasn't scrolled up
+        if self.active_port == port_name and self.auto_scroll:
+            self._log_scrollbar.setValue(self._log_scrollbar.maximum())
     
     def _clear_logs(self):
         """Clear logs for active port."""
         if self.active_port:
-            self.port_logs[self.active_port] = []
-            self.log_text_edit.clear()
-            self.log_text_edit.append(self.log_formatter.create_info_message('Logs cleared'))
+            self._pending_lines.pop(self.active_port, None)
+            self._get_port_doc(self.active_port).clear()
+            self._append_to_port(
+                self.active_port,
+                [self.log_formatter.create_info_message('Logs cleared')]
+            )
             self.auto_scroll = True
     
     def _save_logs(self):
@@ -396,9 +593,14 @@ class MainWindow(QWidget):
             )
             
             if filename:
-                with open(filename, 'w') as f:
-                    plain_text = self.log_text_edit.toPlainText()
-                    f.write(plain_text)
+                # Write block by block to avoid building one large string
+                doc = self.log_text_edit.document()
+                with open(filename, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                    block = doc.begin()
+                    while block.isValid():
+                        f.write(block.text())
+                        f.write('\n')
+                        block = block.next()
                 
                 QMessageBox.information(self, "Success", f"Logs saved to {filename}")
         except Exception as e:
@@ -406,21 +608,12 @@ class MainWindow(QWidget):
     
     def _reconnect_all_ports(self):
         """Reconnect all ports."""
-        for i in range(self.port_list.count()):
-            port_name = self.port_list.item(i).text()
-            if port_name == "No USB devices connected":
-                continue
-            
+        for port_name in list(self._port_items):
             log_entry = self.log_formatter.create_warning_message(
                 f'Reconnecting {port_name}...'
             )
             
-            if port_name not in self.port_logs:
-                self.port_logs[port_name] = []
-            self.port_logs[port_name].append(log_entry)
-            
-            if self.active_port == port_name:
-                self.log_text_edit.append(log_entry)
+            self._append_to_port(port_name, [log_entry])
             
             self._start_serial_monitor(port_name)
     
@@ -433,8 +626,7 @@ class MainWindow(QWidget):
         log_entry = self.log_formatter.create_warning_message(
             f'Rebooting ESP32 on {self.active_port}...'
         )
-        self.port_logs[self.active_port].append(log_entry)
-        self.log_text_edit.append(log_entry)
+        self._append_to_port(self.active_port, [log_entry])
         
         # Pass callback to handle completion
         success = self.serial_service.reboot_esp32(
@@ -451,8 +643,7 @@ class MainWindow(QWidget):
             error_msg = self.log_formatter.create_error_message(
                 'Failed to reboot ESP32: Port not connected'
             )
-            self.port_logs[self.active_port].append(error_msg)
-            self.log_text_edit.append(error_msg)
+            self._append_to_port(self.active_port, [error_msg])
     
     def _handle_reboot_completion(self, success: bool, error: str = None):
         """Handle ESP32 reboot completion."""
@@ -465,9 +656,8 @@ class MainWindow(QWidget):
                 f'Reboot completion failed: {error}'
             )
         
-        if self.active_port in self.port_logs:
-            self.port_logs[self.active_port].append(log_entry)
-            self.log_text_edit.append(log_entry)
+        if self.active_port:
+            self._append_to_port(self.active_port, [log_entry])
     
     def _select_file_for_crc(self):
         """Open file dialog to select file for CRC calculation."""
@@ -488,23 +678,49 @@ class MainWindow(QWidget):
             self._calculate_crc(filename)
     
     def _calculate_crc(self, filename: str):
-        """Calculate and display CRC32 for a file."""
-        try:
-            crc32, file_size, file_name = self.crc_service.calculate_crc32(filename)
-            crc_hex = self.crc_service.format_crc32_hex(crc32)
-            size_str = self.crc_service.format_file_size(file_size)
-            
-            self.crc_result.set_crc_data(crc_hex, file_name, size_str)
-            
-        except Exception as e:
-            self.crc_result.set_error(str(e))
+        """Calculate CRC32 for a file in the thread pool."""
+        if self._crc_worker is not None:
+            return
+        
+        self.crc_button.setEnabled(False)
+        
+        self._crc_worker = CrcWorker(self.crc_service, filename)
+        self._crc_worker.signals.finished.connect(self._on_crc_done)
+        self._crc_worker.signals.error.connect(self._on_crc_error)
+        QThreadPool.globalInstance().start(self._crc_worker)
+    
+    def _on_crc_done(self, crc_hex: str, file_name: str, size_str: str):
+        """Display the calculated CRC32."""
+        self._release_crc_worker()
+        self.crc_result.set_crc_data(crc_hex, file_name, size_str)
+    
+    def _on_crc_error(self, error_message: str):
+        """Display a CRC calculation error."""
+        self._release_crc_worker()
+        self.crc_result.set_error(error_message)
+    
+    def _release_crc_worker(self):
+        """Forget the finished CRC worker and re-enable the CRC button."""
+        self._crc_worker = None
+        self.crc_button.setEnabled(True)
+    
+    def nativeEvent(self, event_type, message):
+        """Mark the port list stale when Windows reports a device change."""
+        if sys.platform == 'win32' and event_type == b'windows_generic_MSG':
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == _WM_DEVICECHANGE:
+                self._ports_dirty = True
+        return super().nativeEvent(event_type, message)
     
     def closeEvent(self, event):
         """Clean up when window is closed."""
-        if self.logger_timer:
-            self.logger_timer.stop()
         if self.port_refresh_timer:
             self.port_refresh_timer.stop()
+        self.log_flush_timer.stop()
+        self._closing = True
+        self._scan_pool.waitForDone()
         
+        for port_name in list(self._notifiers) + list(self._readers):
+            self._unwatch_port(port_name)
         self.serial_service.close_all_ports()
         event.accept()
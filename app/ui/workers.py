@@ -0,0 +1,102 @@
+"""Background workers for long-running tasks."""
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
+
+from app.services import CRCService, SerialPortService
+
+
+class CrcWorkerSignals(QObject):
+    """Signals of a CrcWorker; QRunnable can't define its own."""
+    
+    finished = pyqtSignal(str, str, str)
+    error = pyqtSignal(str)
+
+
+class CrcWorker(QRunnable):
+    """Thread pool task that calculates a file CRC32 off the GUI thread."""
+    
+    def __init__(self, crc_service: CRCService, file_path: str):
+        """
+        Initialize CRC worker.
+        
+        Args:
+            crc_service: Service used to calculate the checksum
+            file_path: Path to the file to calculate CRC for
+        """
+        super().__init__()
+        self.crc_service = crc_service
+        self.file_path = file_path
+        self.signals = CrcWorkerSignals()
+    
+    def run(self):
+        """Calculate the CRC and emit the formatted result."""
+        try:
+            crc32, file_size, file_name = self.crc_service.calculate_crc32(self.file_path)
+            crc_hex = self.crc_service.format_crc32_hex(crc32)
+            size_str = self.crc_service.format_file_size(file_size)
+            self.signals.finished.emit(crc_hex, file_name, size_str)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+
+class SerialReader(QObject):
+    """Worker that reads lines from a serial port off the GUI thread."""
+    
+    lines_read = pyqtSignal(str, list)
+    finished = pyqtSignal(str)
+    
+    def __init__(self, serial_service: SerialPortService, port_name: str):
+        """
+        Initialize serial reader.
+        
+        Args:
+            serial_service: Service owning the open port
+            port_name: Name of the port to read from
+        """
+        super().__init__()
+        self.serial_service = serial_service
+        self.port_name = port_name
+        self._running = True
+    
+    @pyqtSlot()
+    def run(self):
+        """Read lines until stopped or the port is closed."""
+        while self._running and self.port_name in self.serial_service.connections:
+            # Blocks for up to the port timeout when no data arrives
+            lines = self.serial_service.read_lines(self.port_name, ready=True)
+            if lines and self._running:
+                self.lines_read.emit(self.port_name, lines)
+        self.finished.emit(self.port_name)
+    
+    def stop(self):
+        """Ask the read loop to exit after the current read."""
+        self._running = False
+
+
+class PortScannerSignals(QObject):
+    """Signals of a PortScanner; QRunnable can't define its own."""
+    
+    finished = pyqtSignal(list)
+
+
+class PortScanner(QRunnable):
+    """Thread pool task that enumerates USB serial ports."""
+    
+    def __init__(self, serial_service: SerialPortService):
+        """
+        Initialize port scanner.
+        
+        Args:
+            serial_service: Service used to enumerate the ports
+        """
+        super().__init__()
+        self.serial_service = serial_service
+        self.signals = PortScannerSignals()
+    
+    def run(self):
+        """Enumerate the ports and emit the device names."""
+        try:
+            ports = self.serial_service.get_available_usb_ports()
+        except Exception:
+            ports = []
+        self.signals.finished.emit(ports)
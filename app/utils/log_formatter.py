@@ -1,6 +1,7 @@
 """Utility for formatting and colorizing log messages."""
 
-from typing import Dict
+import re
+from typing import List, Optional, Tuple
 
 
 class LogFormatter:
@@ -15,32 +16,87 @@ class LogFormatter:
         '[0;31mE': 'red',     # Error (Red)
     }
     
-    @staticmethod
-    def colorize_line(line: str) -> str:
+    # ESP-IDF lines start with ESC followed by a color code, so the
+    # common case is resolved with one startswith and one dict lookup
+    _ESCAPE_PREFIX = '\x1b[0;'
+    _PREFIX_COLORS = {'\x1b' + code: color for code, color in LOG_COLOR_CODES.items()}
+    _PREFIX_LENGTH = 1 + len('[0;32mI')
+    
+    # Single alternation over all color codes, matched in one scan per line
+    _PATTERN = re.compile('|'.join(re.escape(code) for code in LOG_COLOR_CODES))
+    
+    # Paragraph markup per color, built once instead of on every message
+    _PREFIXES = {
+        color: f'<p style="color:{color};">'
+        for color in ('cyan', 'green', 'yellow', 'red', 'lime', 'orange', 'gray')
+    }
+    _SUFFIX = '</p>'
+    
+    @classmethod
+    def _wrap(cls, color: str, message: str) -> str:
         """
-        Apply HTML color formatting to a log line based on ESP-IDF color codes.
+        Wrap a message in a colored paragraph.
+        
+        Args:
+            color: Color name with a prefix in _PREFIXES
+            message: Message text
+            
+        Returns:
+            HTML formatted message
+        """
+        return cls._PREFIXES[color] + message + cls._SUFFIX
+    
+    @classmethod
+    def parse_line(cls, line: str) -> Tuple[Optional[str], str]:
+        """
+        Split a log line into its ESP-IDF color and display text.
         
         Args:
             line: Raw log line from serial port
             
         Returns:
-            HTML formatted line with color styling
+            Tuple of (color name or None for plain lines, text without color code)
         """
+        # Fast path: color code at the start of the line
+        if line.startswith(cls._ESCAPE_PREFIX):
+            color = cls._PREFIX_COLORS.get(line[:cls._PREFIX_LENGTH])
+            if color:
+                return color, line[cls._PREFIX_LENGTH:]
+        
         # Check for specific error patterns
         if 'Error:' in line:
-            return f'<p style="color:red;">{line}</p>'
+            return 'red', line
         
         # Check for ESP-IDF color codes
-        for code, color in LogFormatter.LOG_COLOR_CODES.items():
-            if code in line:
-                cleaned_line = line.replace(code, '')
-                return f'<p style="color:{color};">{cleaned_line}</p>'
+        match = cls._PATTERN.search(line)
+        if match:
+            code = match.group(0)
+            return cls.LOG_COLOR_CODES[code], line.replace(code, '')
+        
+        return None, line
+    
+    @classmethod
+    def parse_batch(cls, raw_lines: List[bytes]) -> List[Tuple[Optional[str], str]]:
+        """
+        Decode several undecoded log lines and split them into color and text.
         
-        # Return plain line if no color code found
-        return line
+        The batch is decoded with a single call; newlines are ASCII, so
+        splitting the decoded text gives back the same lines.
+        
+        Args:
+            raw_lines: Undecoded log lines without line endings
+            
+        Returns:
+            List of (color, text) tuples, in the same order
+        """
+        if not raw_lines:
+            return []
+        text = b'\n'.join(raw_lines).decode('utf-8', errors='ignore')
+        parse_line = cls.parse_line
+        return [parse_line(line) for line in text.split('\n')]
     
-    @staticmethod
-    def create_success_message(message: str) -> str:
+    @classmethod
+    def create_success_message(cls, message: str) -> str:
         """
         Create a success message in green color.
         
@@ -50,10 +106,10 @@ class LogFormatter:
         Returns:
             HTML formatted success message
         """
-        return f'<p style="color:lime;">{message}</p>'
+        return cls._wrap('lime', message)
     
-    @staticmethod
-    def create_error_message(message: str) -> str:
+    @classmethod
+    def create_error_message(cls, message: str) -> str:
         """
         Create an error message in red color.
         
@@ -63,10 +119,10 @@ class LogFormatter:
         Returns:
             HTML formatted error message
         """
-        return f'<p style="color:red;">{message}</p>'
+        return cls._wrap('red', message)
     
-    @staticmethod
-    def create_warning_message(message: str) -> str:
+    @classmethod
+    def create_warning_message(cls, message: str) -> str:
         """
         Create a warning message in orange color.
         
@@ -76,10 +132,10 @@ class LogFormatter:
         Returns:
             HTML formatted warning message
         """
-        return f'<p style="color:orange;">{message}</p>'
+        return cls._wrap('orange', message)
     
-    @staticmethod
-    def create_info_message(message: str) -> str:
+    @classmethod
+    def create_info_message(cls, message: str) -> str:
         """
         Create an info message in gray color.
         
@@ -89,4 +145,4 @@ class LogFormatter:
         Returns:
             HTML formatted info message
         """
-        return f'<p style="color:gray;">{message}</p>'
+        return cls._wrap('gray', message)
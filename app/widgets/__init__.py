@@ -1,5 +1,6 @@
 """Widgets package initialization."""
 
 from app.widgets.custom_widgets import DropButton, ClickableLabel
+from app.widgets.styles import STYLESHEET
 
-__all__ = ['DropButton', 'ClickableLabel']
+__all__ = ['DropButton', 'ClickableLabel', 'STYLESHEET']
@@ -0,0 +1,67 @@
+"""Application-wide Qt stylesheet."""
+
+# Installed once on the QApplication. Widgets select their look through the
+# "role" and "state" dynamic properties instead of setting their own
+# stylesheets, so a state change only re-polishes the widget.
+STYLESHEET = """
+QPushButton[role="drop"] {
+    border: 2px dashed rgba(0, 0, 0, 0.3);
+    border-radius: 5px;
+    background-color: rgba(0, 120, 215, 0.05);
+    padding: 10px;
+}
+QPushButton[role="drop"]:hover {
+    background-color: rgba(0, 120, 215, 0.1);
+    border: 2px dashed rgba(0, 120, 215, 0.5);
+}
+QPushButton[role="drop"][state="dragging"] {
+    background-color: rgba(0, 120, 215, 0.2);
+    border: 2px dashed rgba(0, 120, 215, 0.5);
+}
+
+QLabel[role="crc"] {
+    font-size: 11px;
+    color: gray;
+    padding: 15px;
+    border: 1px solid rgba(0, 0, 0, 0.2);
+    border-radius: 5px;
+    background-color: rgba(0, 0, 0, 0.02);
+}
+QLabel[role="crc"][state="idle"]:hover {
+    background-color: rgba(0, 120, 215, 0.05);
+    border: 1px solid rgba(0, 120, 215, 0.3);
+}
+QLabel[role="crc"][state="success"] {
+    color: green;
+    border: 1px solid rgba(0, 200, 0, 0.3);
+    background-color: rgba(0, 200, 0, 0.05);
+}
+QLabel[role="crc"][state="success"]:hover {
+    background-color: rgba(0, 200, 0, 0.1);
+    border: 1px solid rgba(0, 200, 0, 0.5);
+}
+QLabel[role="crc"][state="pressed"] {
+    color: green;
+    padding: 16px 14px 14px 16px;
+    border: 1px solid rgba(0, 200, 0, 0.5);
+    background-color: rgba(0, 200, 0, 0.15);
+}
+QLabel[role="crc"][state="copied"] {
+    color: green;
+    border: 1px solid rgba(0, 200, 0, 0.5);
+    background-color: rgba(0, 255, 0, 0.25);
+}
+QLabel[role="crc"][state="error"] {
+    color: red;
+    border: 1px solid rgba(255, 0, 0, 0.3);
+    background-color: rgba(255, 0, 0, 0.05);
+}
+
+QListWidget[role="ports"]::item {
+    border-bottom: 1px solid rgba(0, 0, 0, 0.1);
+    padding: 5px;
+}
+QListWidget[role="ports"]::item:selected {
+    background-color: rgba(0, 120, 215, 0.15);
+}
+"""
@@ -9,12 +9,14 @@ from PyQt5.QtWidgets import QApplication
 
 from app import APP_NAME
 from app.ui import MainWindow
+from app.widgets import STYLESHEET
 
 
 def main():
     """Initialize and run the application."""
     app = QApplication(sys.argv)
     app.setApplicationName(APP_NAME)
+    app.setStyleSheet(STYLESHEET)
     
     window = MainWindow()
     window.show()
@@ -0,0 +1,53 @@
+"""Tests for the main application window."""
+
+import os
+import subprocess
+import sys
+import textwrap
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class PortScanShutdownTest(unittest.TestCase):
+    """Closing the window must not crash a port scan still running."""
+
+    # Runs in a child process: the failure mode is a Qt abort, which
+    # would take the test runner down with it
+    SCRIPT = textwrap.dedent("""
+        import sys, time
+        from PyQt5.QtCore import QTimer
+        from PyQt5.QtWidgets import QApplication
+        from app.services import SerialPortService
+
+        def slow_scan(self):
+            time.sleep(0.2)
+            return []
+
+        SerialPortService.get_available_usb_ports = slow_scan
+
+        # Same shutdown sequence as main.main()
+        def main():
+            app = QApplication(sys.argv)
+            from app.ui import MainWindow
+            window = MainWindow()
+            window.show()
+            QTimer.singleShot(50, window.close)
+            QTimer.singleShot(60, app.quit)
+            sys.exit(app.exec_())
+
+        main()
+    """)
+
+    def test_close_during_scan(self):
+        """Exit cleanly when the window closes while a scan is running."""
+        env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+        result = subprocess.run(
+            [sys.executable, '-c', self.SCRIPT],
+            cwd=ROOT, env=env, capture_output=True, text=True, timeout=30
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()